@@ -0,0 +1,289 @@
+"""
+Multi-session load test
+
+Drives simulated sessions through the input -> outline -> presentation flow
+of the app with Streamlit's AppTest, against the local stand-in services from
+stub_servers.py (run in a separate process so they do not skew CPU numbers).
+
+Each session also goes back to the settings once to change the slide count.
+That regeneration should reuse the already scraped corpus.
+
+All sessions share this process, just as all sessions of one Streamlit
+server share its process, so the results approximate the capacity of a
+single worker.
+
+Usage:
+    python benchmarks/load_test.py --sessions 32 --concurrency 1,4,16 --profile realistic 2>/dev/null
+"""
+
+import argparse
+import json
+import os
+import resource
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from streamlit import config
+from streamlit.runtime import Runtime
+from streamlit.testing.v1 import AppTest
+
+from stub_servers import PROFILES
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+APP_PATH = str(ROOT / "presentation_generator_webscraping.py")
+STUB_SERVERS = str(ROOT / "benchmarks" / "stub_servers.py")
+
+STEPS = ('input', 'outline', 'regenerate', 'presentation')
+
+TOPICS = ["Artificial Intelligence", "Climate Change", "Quantum Computing", "Ancient Egypt", "Renewable Energy"]
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile"""
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+def rss_bytes():
+    """Current resident set size of this process"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Peak, not current, RSS; good enough where /proc is unavailable
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def cpu_seconds():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def start_stub_servers(args):
+    """Launch stub_servers.py in a subprocess and wait until it accepts connections"""
+    port = free_port()
+    cmd = [sys.executable, STUB_SERVERS, "--port", str(port), "--profile", args.profile]
+    for flag in ("latency_ms", "jitter_ms", "failure_rate", "reset_rate"):
+        value = getattr(args, flag)
+        if value is not None:
+            cmd += [f"--{flag.replace('_', '-')}", str(value)]
+    process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL)
+
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process, f"http://127.0.0.1:{port}"
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError("Stub servers did not start")
+
+def prepare_concurrent_apptest():
+    """Make AppTest's process-global state safe for concurrent sessions.
+
+    AppTest installs a mock Runtime and turns on ``global.appTest`` at the
+    start of every run, and undoes both at the end, which breaks any other
+    session running at the same time. A real server has a single Runtime
+    shared by all sessions, so keep the first one AppTest creates and hand it
+    out for the rest of the process, and leave ``global.appTest`` on.
+    """
+    config.set_option("global.appTest", True)
+
+    shared = []
+
+    def instance(cls):
+        if cls._instance is not None and not shared:
+            shared.append(cls._instance)
+        if shared:
+            return shared[0]
+        raise RuntimeError("Runtime hasn't been created!")
+
+    def exists(cls):
+        return bool(shared) or cls._instance is not None
+
+    Runtime.instance = classmethod(instance)
+    Runtime.exists = classmethod(exists)
+
+def run_session(session_id, timeout, live_sessions, prefetch=False, think_time=0):
+    """Walk one session through the whole flow and time each step
+
+    ``think_time`` is how long the simulated user waits between entering
+    the topic and clicking the button, which is when prefetch can work.
+    """
+    timings = {}
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    live_sessions.append(at)
+
+    start = time.perf_counter()
+    at.run()
+    timings['input'] = time.perf_counter() - start
+
+    if prefetch:
+        at.sidebar.checkbox[0].check()
+    at.sidebar.text_input[0].input(TOPICS[session_id % len(TOPICS)])
+    if think_time:
+        at.run()
+        time.sleep(think_time)
+    start = time.perf_counter()
+    at.sidebar.button[0].click().run()
+    timings['outline'] = time.perf_counter() - start
+    if at.exception or at.session_state.generation_step != 'outline':
+        return timings, "no outline"
+
+    # Back to settings, change the slide count and regenerate from the corpus
+    at.sidebar.button[1].click().run()
+    at.sidebar.slider[0].set_value(12)
+    start = time.perf_counter()
+    at.sidebar.button[0].click().run()
+    timings['regenerate'] = time.perf_counter() - start
+    if at.exception or at.session_state.generation_step != 'outline':
+        return timings, "no regenerated outline"
+
+    start = time.perf_counter()
+    at.sidebar.button[0].click().run()
+    timings['presentation'] = time.perf_counter() - start
+    if at.exception or at.session_state.generation_step != 'presentation':
+        return timings, "no presentation"
+
+    return timings, None
+
+def run_level(concurrency, sessions, timeout, prefetch=False, think_time=0):
+    """Run ``sessions`` sessions with at most ``concurrency`` in flight"""
+    # Keep every AppTest alive until the level ends, so RSS reflects live sessions
+    live_sessions = []
+    rss_before = rss_bytes()
+    cpu_before = cpu_seconds()
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(run_session, i, timeout, live_sessions, prefetch, think_time) for i in range(sessions)]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(({}, f"{type(e).__name__}: {e}"))
+
+    wall = time.perf_counter() - start
+    cpu = cpu_seconds() - cpu_before
+    rss = rss_bytes() - rss_before
+    del live_sessions
+
+    errors = {}
+    for _, error in results:
+        if error:
+            errors[error] = errors.get(error, 0) + 1
+    completed = sessions - sum(errors.values())
+
+    report = {
+        "concurrency": concurrency,
+        "sessions": sessions,
+        "completed": completed,
+        "errors": errors,
+        "wall_s": wall,
+        "throughput_sessions_per_s": completed / wall if wall else 0,
+        "cpu_ms_per_session": cpu / sessions * 1000,
+        "rss_mb_per_session": rss / sessions / 2**20,
+        "steps": {}
+    }
+    for step in STEPS:
+        values = [timings[step] * 1000 for timings, _ in results if step in timings]
+        report["steps"][step] = {
+            "p50_ms": percentile(values, 50),
+            "p99_ms": percentile(values, 99),
+            "mean_ms": statistics.mean(values) if values else float('nan')
+        }
+    return report
+
+def print_report(reports, slo_ms):
+    header = f"{'conc':>5}{'ok':>6}{'fail':>6}{'sess/s':>9}{'cpu ms':>9}{'rss MB':>8}"
+    for step in STEPS:
+        header += f"{step[:7] + ' p50':>13}{'p99':>9}"
+    print(header)
+    for r in reports:
+        line = (f"{r['concurrency']:>5}{r['completed']:>6}{r['sessions'] - r['completed']:>6}"
+                f"{r['throughput_sessions_per_s']:>9.2f}{r['cpu_ms_per_session']:>9.1f}"
+                f"{r['rss_mb_per_session']:>8.2f}")
+        for step in STEPS:
+            line += f"{r['steps'][step]['p50_ms']:>13.0f}{r['steps'][step]['p99_ms']:>9.0f}"
+        print(line)
+        for error, count in r['errors'].items():
+            print(f"      {count} x {error}")
+
+    # Capacity summary
+    print()
+    within_slo = [r for r in reports if r['steps']['outline']['p99_ms'] <= slo_ms and not r['errors']]
+    if within_slo:
+        best = max(within_slo, key=lambda r: r['concurrency'])
+        print(f"Highest tested concurrency with outline p99 <= {slo_ms:.0f} ms: {best['concurrency']} "
+              f"({best['throughput_sessions_per_s']:.2f} sessions/s)")
+    else:
+        print(f"No tested concurrency kept outline p99 <= {slo_ms:.0f} ms without errors")
+    cpu_ms = statistics.mean(r['cpu_ms_per_session'] for r in reports)
+    if cpu_ms > 0:
+        print(f"CPU-bound ceiling: ~{1000 / cpu_ms:.1f} sessions/s per core ({cpu_ms:.0f} ms CPU per session)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-session load test against local stand-in services")
+    parser.add_argument("--sessions", type=int, default=16, help="Sessions per concurrency level")
+    parser.add_argument("--concurrency", default="1,4,16", help="Comma-separated concurrency levels")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="realistic",
+                        help="Stub latency/failure profile (see stub_servers.py)")
+    parser.add_argument("--latency-ms", type=float)
+    parser.add_argument("--jitter-ms", type=float)
+    parser.add_argument("--failure-rate", type=float)
+    parser.add_argument("--reset-rate", type=float)
+    parser.add_argument("--scrape-delay", type=float,
+                        help="Delay between requests in a scraping run (default: the app's, as in production)")
+    parser.add_argument("--prefetch", action="store_true", help="Turn on prefetch while typing in every session")
+    parser.add_argument("--think-time", type=float, default=0, help="Seconds between entering the topic and clicking")
+    parser.add_argument("--timeout", type=float, default=120, help="Per-rerun AppTest timeout in seconds")
+    parser.add_argument("--slo-ms", type=float, default=10000, help="Outline step p99 target for the capacity summary")
+    parser.add_argument("--json", help="Also write the raw results to this file")
+    args = parser.parse_args()
+
+    stubs, base_url = start_stub_servers(args)
+    try:
+        # Must be set before the app package is first imported by AppTest
+        os.environ["PPTGEN_DUCKDUCKGO_SEARCH_URL"] = f"{base_url}/html/"
+        os.environ["PPTGEN_WIKIPEDIA_BASE_URL"] = f"{base_url}/wiki/"
+        if args.scrape_delay is not None:
+            os.environ["PPTGEN_SCRAPE_DELAY"] = str(args.scrape_delay)
+        # Report the delay the app actually uses
+        from presentation_generator.config import SCRAPE_DELAY
+        args.scrape_delay = SCRAPE_DELAY
+
+        # Warm-up session pays for imports outside of the measurements
+        prepare_concurrent_apptest()
+        run_session(0, args.timeout, [])
+
+        reports = []
+        for concurrency in (int(c) for c in args.concurrency.split(",")):
+            reports.append(run_level(concurrency, args.sessions, args.timeout, args.prefetch, args.think_time))
+            print(f"concurrency {concurrency} done", file=sys.stderr)
+    finally:
+        stubs.terminate()
+        stubs.wait()
+
+    print(f"profile={args.profile} sessions/level={args.sessions} scrape_delay={args.scrape_delay}s "
+          f"prefetch={args.prefetch} think_time={args.think_time}s")
+    print_report(reports, args.slo_ms)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"args": vars(args), "scrape_delay_s": args.scrape_delay, "reports": reports}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
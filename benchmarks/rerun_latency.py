@@ -0,0 +1,113 @@
+"""
+Rerun latency benchmark
+
+Measures how long a single Streamlit rerun takes for each ``generation_step``
+using Streamlit's AppTest harness. No network access is needed: the outline
+and presentation steps are seeded with a synthetic scraped corpus.
+
+Usage:
+    python benchmarks/rerun_latency.py [--reruns 50] 2>/dev/null
+
+AppTest seeds session state outside a script run, so Streamlit logs
+"missing ScriptRunContext" warnings on stderr; they can be ignored.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from presentation_generator.config import SESSION_DEFAULTS, THEME_NAMES  # noqa: E402
+from presentation_generator.outline import (  # noqa: E402
+    generate_outline_from_web,
+)
+
+APP_PATH = str(ROOT / "presentation_generator_webscraping.py")
+
+SAMPLE_PARAGRAPH = (
+    "Artificial intelligence is the capability of computational systems to perform tasks "
+    "typically associated with human intelligence. It is a field of research in computer "
+    "science that develops methods and software that enable machines to perceive their "
+    "environment. Such machines may be called AIs."
+)
+
+def sample_scraped_data(num_sources=3):
+    """Synthetic corpus shaped like the output of scrape_web_for_topic"""
+    scraped_data = [{
+        'source': 'Wikipedia',
+        'url': 'https://en.wikipedia.org/wiki/Artificial_intelligence',
+        'title': 'Artificial intelligence',
+        'paragraphs': [SAMPLE_PARAGRAPH] * 5,
+        'sections': [f"Section {i}" for i in range(10)]
+    }]
+    for idx in range(1, num_sources):
+        scraped_data.append({
+            'source': f'example{idx}.com',
+            'url': f'https://example{idx}.com/article',
+            'title': f'Example article {idx}',
+            'paragraphs': [SAMPLE_PARAGRAPH] * 10,
+            'headings': [f"Heading {i}" for i in range(10)]
+        })
+    return scraped_data
+
+def new_app(step):
+    """Create an AppTest positioned at the given generation step"""
+    at = AppTest.from_file(APP_PATH, default_timeout=30)
+    if step == 'input':
+        return at
+
+    scraped_data = sample_scraped_data()
+    for key, value in SESSION_DEFAULTS.items():
+        at.session_state[key] = value
+    at.session_state.scraped_data = scraped_data
+    at.session_state.outline = generate_outline_from_web("Artificial Intelligence", 12, scraped_data)
+    at.session_state.generation_step = 'outline'
+    if step == 'presentation':
+        # Go through the real button handler so exports are built as in the app
+        at.run()
+        at.sidebar.button[0].click().run()
+    return at
+
+def interact(at, step, i):
+    """Trigger one widget-driven rerun for the given step"""
+    if step == 'input':
+        at.sidebar.slider[0].set_value(5 + i % 8).run()
+    elif step == 'outline':
+        at.sidebar.selectbox[0].set_value(THEME_NAMES[i % len(THEME_NAMES)]).run()
+    else:
+        at.run()
+
+def bench_step(step, reruns):
+    at = new_app(step)
+    at.run()  # warm-up: first run pays for imports and session init
+    assert at.session_state.generation_step == step, at.session_state.generation_step
+    assert not at.exception, at.exception
+
+    timings = []
+    for i in range(reruns):
+        start = time.perf_counter()
+        interact(at, step, i)
+        timings.append((time.perf_counter() - start) * 1000)
+        assert not at.exception, at.exception
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--reruns", type=int, default=50, help="Reruns measured per step")
+    args = parser.parse_args()
+
+    print(f"{'step':<14}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for step in ('input', 'outline', 'presentation'):
+        timings = sorted(bench_step(step, args.reruns))
+        p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+        print(f"{step:<14}{statistics.mean(timings):>10.2f}{statistics.median(timings):>10.2f}"
+              f"{p99:>10.2f}{timings[-1]:>10.2f}")
+
+if __name__ == "__main__":
+    main()
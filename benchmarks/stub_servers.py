@@ -0,0 +1,200 @@
+"""
+Local stand-ins for DuckDuckGo, Wikipedia and arbitrary websites
+
+One threaded HTTP server answers three route families, each with its own
+latency and failure profile:
+
+    /html/?q=<query>     DuckDuckGo HTML search results
+    /wiki/<Topic>        Wikipedia article
+    /site/<slug>/<n>     Arbitrary website article (linked from search results)
+
+Point the app at it with the PPTGEN_* environment variables printed on
+startup, e.g. to load-test a real ``streamlit run`` process:
+
+    python benchmarks/stub_servers.py --port 8765 --profile realistic
+"""
+
+import argparse
+import random
+import socket
+import threading
+import time
+from dataclasses import dataclass, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, unquote, urlparse
+
+PARAGRAPH = (
+    "{topic} has been studied extensively by researchers around the world. "
+    "Its history spans several decades of steady progress and occasional setbacks. "
+    "Today {topic} influences industry, education and public policy in many countries. "
+    "Experts expect its importance to keep growing over the next few years."
+)
+
+
+@dataclass(frozen=True)
+class Profile:
+    """Latency and failure behaviour for one route family"""
+    latency_ms: float = 0
+    jitter_ms: float = 0
+    failure_rate: float = 0  # Fraction of requests answered with failure_status
+    failure_status: int = 503
+    reset_rate: float = 0  # Fraction of requests whose connection is dropped
+
+    def delay(self):
+        return max(0.0, self.latency_ms + random.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+
+
+# Route family -> profile
+PROFILES = {
+    "instant": {
+        "search": Profile(),
+        "wiki": Profile(),
+        "site": Profile()
+    },
+    "realistic": {
+        "search": Profile(latency_ms=300, jitter_ms=100),
+        "wiki": Profile(latency_ms=150, jitter_ms=50),
+        "site": Profile(latency_ms=400, jitter_ms=200, failure_rate=0.05, failure_status=403)
+    },
+    "slow": {
+        "search": Profile(latency_ms=1500, jitter_ms=500),
+        "wiki": Profile(latency_ms=800, jitter_ms=300),
+        "site": Profile(latency_ms=2500, jitter_ms=1000)
+    },
+    "flaky": {
+        "search": Profile(latency_ms=300, jitter_ms=100, failure_rate=0.2),
+        "wiki": Profile(latency_ms=150, jitter_ms=50, failure_rate=0.2, failure_status=404),
+        "site": Profile(latency_ms=400, jitter_ms=200, failure_rate=0.2, failure_status=403, reset_rate=0.1)
+    }
+}
+
+
+def build_profiles(name="realistic", latency_ms=None, jitter_ms=None, failure_rate=None, reset_rate=None):
+    """Resolve a named profile, overriding fields on every route family"""
+    overrides = {
+        key: value for key, value in {
+            "latency_ms": latency_ms,
+            "jitter_ms": jitter_ms,
+            "failure_rate": failure_rate,
+            "reset_rate": reset_rate
+        }.items() if value is not None
+    }
+    return {route: replace(profile, **overrides) for route, profile in PROFILES[name].items()}
+
+def search_page(base_url, query, num_results=10):
+    links = "\n".join(
+        f'<div class="result"><a class="result__a" href="{base_url}/site/{quote(query)}/{n}">'
+        f'{query} - result {n}</a></div>'
+        for n in range(num_results)
+    )
+    return f"<html><body>{links}</body></html>"
+
+def wiki_page(topic):
+    paragraphs = "\n".join(f"<p>{PARAGRAPH.format(topic=topic)}</p>" for _ in range(5))
+    sections = "\n".join(f"<h2>{topic} section {n}[edit]</h2>" for n in range(1, 9))
+    return (
+        f'<html><body><h1 class="firstHeading">{topic}</h1>'
+        f'<div class="mw-parser-output">{paragraphs}</div>{sections}</body></html>'
+    )
+
+def site_page(topic, n):
+    paragraphs = "\n".join(f"<p>{PARAGRAPH.format(topic=topic)}</p>" for _ in range(10))
+    headings = "\n".join(f"<h2>{topic} insight {n}.{i}</h2>" for i in range(1, 6))
+    return (
+        f"<html><head><title>{topic} article {n}</title></head><body>"
+        f"<nav>Menu</nav><main><h1>{topic} article {n}</h1>{headings}{paragraphs}</main>"
+        f"<footer>Footer</footer></body></html>"
+    )
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        parts = [unquote(p) for p in parsed.path.strip("/").split("/")]
+
+        if parts[0] == "html":
+            route = "search"
+            query = parse_qs(parsed.query).get("q", [""])[0]
+            render = lambda: search_page(self.server.base_url, query)
+        elif parts[0] == "wiki" and len(parts) > 1:
+            route = "wiki"
+            render = lambda: wiki_page(parts[1].replace("_", " "))
+        elif parts[0] == "site" and len(parts) > 2:
+            route = "site"
+            render = lambda: site_page(parts[1], parts[2])
+        else:
+            self.send_error(404)
+            return
+
+        profile = self.server.profiles[route]
+        time.sleep(profile.delay())
+
+        roll = random.random()
+        if roll < profile.reset_rate:
+            # Drop the connection without a response
+            self.connection.shutdown(socket.SHUT_RDWR)
+            self.close_connection = True
+            return
+        if roll < profile.reset_rate + profile.failure_rate:
+            self.send_error(profile.failure_status)
+            return
+
+        body = render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, profiles, host="127.0.0.1", port=0):
+        super().__init__((host, port), StubHandler)
+        self.profiles = profiles
+        self.base_url = f"http://{host}:{self.server_address[1]}"
+
+    @property
+    def env(self):
+        """Environment variables pointing the app at this server"""
+        return {
+            "PPTGEN_DUCKDUCKGO_SEARCH_URL": f"{self.base_url}/html/",
+            "PPTGEN_WIKIPEDIA_BASE_URL": f"{self.base_url}/wiki/"
+        }
+
+    def start(self):
+        """Serve from a daemon thread and return self"""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-ins for the scraped services")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="realistic")
+    parser.add_argument("--latency-ms", type=float)
+    parser.add_argument("--jitter-ms", type=float)
+    parser.add_argument("--failure-rate", type=float)
+    parser.add_argument("--reset-rate", type=float)
+    args = parser.parse_args()
+
+    profiles = build_profiles(args.profile, args.latency_ms, args.jitter_ms, args.failure_rate, args.reset_rate)
+    server = StubServer(profiles, args.host, args.port)
+    print(f"Serving stubs on {server.base_url} ({args.profile})")
+    for key, value in server.env.items():
+        print(f"export {key}={value}")
+    print("export PPTGEN_SCRAPE_DELAY=0")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+ALLWEONE Presentation Generator - Web Scraping Version
+Generate presentations with real content from the internet using web scraping
+"""
+
+from .config import THEMES
+from .outline import (
+    build_json_export,
+    build_text_export,
+    enhance_presentation_content,
+    extract_key_points,
+    generate_outline_from_web,
+)
+from .scraping import (
+    scrape_web_for_topic,
+    scrape_website,
+    scrape_wikipedia,
+    search_duckduckgo,
+)
+
+__all__ = [
+    "THEMES",
+    "build_json_export",
+    "build_text_export",
+    "enhance_presentation_content",
+    "extract_key_points",
+    "generate_outline_from_web",
+    "scrape_web_for_topic",
+    "scrape_website",
+    "scrape_wikipedia",
+    "search_duckduckgo",
+]
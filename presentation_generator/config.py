@@ -0,0 +1,216 @@
+"""
+Static configuration for the presentation generator.
+
+Everything in this module is built once at import time. Streamlit caches
+imported modules between reruns, so none of it is rebuilt when a widget
+changes - only the entry script body is re-executed.
+"""
+
+import os
+import re
+
+# Page configuration
+PAGE_CONFIG = {
+    "page_title": "Presentation Generator - Web Scraping",
+    "page_icon": "🌐",
+    "layout": "wide",
+    "initial_sidebar_state": "expanded"
+}
+
+# Custom CSS
+_CUSTOM_CSS_SOURCE = """
+<style>
+    .main-header {
+        font-size: 3rem;
+        font-weight: bold;
+        text-align: center;
+        margin-bottom: 2rem;
+        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+    }
+    .slide-container {
+        border: 2px solid #e0e0e0;
+        border-radius: 10px;
+        padding: 20px;
+        margin: 10px 0;
+        background-color: #f9f9f9;
+    }
+    .slide-title {
+        font-size: 1.5rem;
+        font-weight: bold;
+        color: #333;
+        margin-bottom: 10px;
+    }
+    .slide-content {
+        font-size: 1rem;
+        color: #555;
+        line-height: 1.6;
+    }
+    .source-link {
+        font-size: 0.8rem;
+        color: #666;
+        font-style: italic;
+    }
+    .stButton>button {
+        width: 100%;
+        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 5px;
+        font-weight: bold;
+    }
+</style>
+"""
+
+# Streamlit drops any element a rerun does not emit, so the stylesheet has to
+# be sent on every rerun. Collapse the whitespace once to keep that payload small.
+CUSTOM_CSS = re.sub(r'\s*([{}:;>])\s*', r'\1', re.sub(r'\s+', ' ', _CUSTOM_CSS_SOURCE)).strip()
+
+# Default presentation settings
+DEFAULT_SETTINGS = {
+    'topic': "",
+    'num_slides': 8,
+    'num_sources': 3,
+    'page_style': "Professional",
+    'prefetch': False
+}
+
+# Initial session state, applied once per session
+SESSION_DEFAULTS = {
+    'settings': DEFAULT_SETTINGS,
+    'corpora': {},
+    'generated_outline': None,
+    'outline_key': None,
+    'outline': None,
+    'presentation': None,
+    'selected_theme': "Professional Blue",
+    'generation_step': 'input',
+    'scraped_data': [],
+    'title_slide_html': None,
+    'export_json': None,
+    'export_text': None
+}
+
+# Themes
+THEMES = {
+    "Professional Blue": {
+        "primary_color": "#667eea",
+        "secondary_color": "#764ba2",
+        "background": "#ffffff",
+        "text_color": "#333333"
+    },
+    "Modern Dark": {
+        "primary_color": "#1a1a1a",
+        "secondary_color": "#4a4a4a",
+        "background": "#2d2d2d",
+        "text_color": "#ffffff"
+    },
+    "Elegant Purple": {
+        "primary_color": "#9333ea",
+        "secondary_color": "#c084fc",
+        "background": "#faf5ff",
+        "text_color": "#3b0764"
+    },
+    "Nature Green": {
+        "primary_color": "#059669",
+        "secondary_color": "#10b981",
+        "background": "#f0fdf4",
+        "text_color": "#064e3b"
+    },
+    "Sunset Orange": {
+        "primary_color": "#ea580c",
+        "secondary_color": "#fb923c",
+        "background": "#fff7ed",
+        "text_color": "#7c2d12"
+    },
+    "Ocean Blue": {
+        "primary_color": "#0284c7",
+        "secondary_color": "#38bdf8",
+        "background": "#f0f9ff",
+        "text_color": "#0c4a6e"
+    },
+    "Rose Pink": {
+        "primary_color": "#e11d48",
+        "secondary_color": "#fb7185",
+        "background": "#fff1f2",
+        "text_color": "#881337"
+    },
+    "Tech Gray": {
+        "primary_color": "#4b5563",
+        "secondary_color": "#9ca3af",
+        "background": "#f9fafb",
+        "text_color": "#111827"
+    },
+    "Vibrant Yellow": {
+        "primary_color": "#eab308",
+        "secondary_color": "#facc15",
+        "background": "#fefce8",
+        "text_color": "#713f12"
+    }
+}
+
+THEME_NAMES = list(THEMES.keys())
+
+PAGE_STYLES = ["Professional", "Casual", "Academic", "Creative"]
+
+# Scraping endpoints, overridable so the app can be pointed at local stand-ins
+# (see benchmarks/stub_servers.py)
+DUCKDUCKGO_SEARCH_URL = os.environ.get("PPTGEN_DUCKDUCKGO_SEARCH_URL", "https://html.duckduckgo.com/html/")
+WIKIPEDIA_BASE_URL = os.environ.get("PPTGEN_WIKIPEDIA_BASE_URL", "https://en.wikipedia.org/wiki/")
+
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+REQUEST_TIMEOUT = 10
+
+# Scraped corpora kept per session, one per topic
+CORPUS_CACHE_SIZE = 5
+
+# Delay between requests to the same scraping run, to be nice to servers
+SCRAPE_DELAY = float(os.environ.get("PPTGEN_SCRAPE_DELAY", 1))
+
+# Speculative prefetch while the topic is being typed. The pool and the
+# traffic limit are shared by all sessions of the server process.
+PREFETCH_DEBOUNCE = 1.0  # Seconds the topic must stay unchanged
+PREFETCH_SEARCH_RESULTS = 5  # Enough for the largest "Number of Sources"
+PREFETCH_CACHE_SIZE = 3  # Prefetched topics kept per session
+PREFETCH_MAX_WORKERS = 4
+PREFETCH_MAX_PENDING = 32
+PREFETCH_REQUESTS_PER_MINUTE = 120
+PREFETCH_BURST = 20
+PREFETCH_WAIT_TIMEOUT = 2  # Max wait for an in-flight prefetch before fetching in the foreground
+
+# Compiled regexes
+CITATION_RE = re.compile(r'\[\d+\]')
+SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+CONTENT_CLASS_RE = re.compile('content|main|article')
+
+# Static copy for the input step
+FEATURES_MARKDOWN = """
+            - 🌐 **Web Scraping** - Gathers real content from the internet
+            - 🔍 **Multiple Sources** - Wikipedia + web search results
+            - 📊 **Real Data** - Actual information from credible sources
+            - 🎨 **9 Themes** - Beautiful professional designs
+            - ✏️ **Editable** - Customize after generation
+            - 💾 **Export** - JSON and Text formats
+            - 🆓 **Free** - No API costs
+            """
+
+HOW_IT_WORKS_MARKDOWN = """
+            1. Enter your topic
+            2. App searches Wikipedia and web
+            3. Scrapes content from multiple sources
+            4. Extracts key information
+            5. Generates structured presentation
+            6. You can edit and export!
+            """
+
+IMPORTANT_NOTES_MARKDOWN = """
+            - Scraping takes 10-30 seconds
+            - Quality depends on available sources
+            - Some websites may block scraping
+            - Respects robots.txt guidelines
+            - Always cite your sources
+            """
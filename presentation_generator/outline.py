@@ -0,0 +1,210 @@
+"""
+Outline and presentation building from scraped web data
+"""
+
+import json
+
+from .config import SENTENCE_SPLIT_RE
+
+
+def extract_key_points(text, num_points=3):
+    """Extract key points from text"""
+    # Split into sentences
+    sentences = SENTENCE_SPLIT_RE.split(text)
+    sentences = [s.strip() for s in sentences if len(s.strip()) > 20]
+
+    # Take the most substantial sentences
+    key_points = []
+    for sentence in sentences[:num_points * 2]:
+        if len(sentence) > 30 and len(sentence) < 200:
+            key_points.append(sentence)
+        if len(key_points) >= num_points:
+            break
+
+    return key_points
+
+def generate_outline_from_web(topic, num_slides, scraped_data):
+    """Generate outline from scraped web data"""
+    outline = {
+        "title": f"{topic}",
+        "slides": []
+    }
+
+    # Slide 1: Introduction
+    intro_content = []
+    if scraped_data and scraped_data[0]['paragraphs']:
+        intro_text = scraped_data[0]['paragraphs'][0][:300]
+        intro_content = extract_key_points(intro_text, 3)
+
+    if not intro_content:
+        intro_content = [
+            f"Introduction to {topic}",
+            "Overview of key concepts",
+            "What we'll cover in this presentation"
+        ]
+
+    outline["slides"].append({
+        "slide_number": 1,
+        "title": "Introduction",
+        "content": intro_content,
+        "notes": f"Introduction based on web research about {topic}",
+        "source": scraped_data[0]['url'] if scraped_data else None
+    })
+
+    # Generate slides from sections/headings
+    slide_num = 2
+    for data in scraped_data[:num_slides]:
+        # Use sections or headings as slide titles
+        sections = data.get('sections', data.get('headings', []))
+
+        for section in sections[:num_slides - 1]:
+            if slide_num > num_slides:
+                break
+
+            # Find relevant paragraph for this section
+            content = []
+            for para in data['paragraphs'][:3]:
+                points = extract_key_points(para, 3)
+                content.extend(points)
+                if len(content) >= 3:
+                    break
+
+            # Ensure we have at least 3 points
+            while len(content) < 3:
+                content.append(f"Additional information about {section}")
+
+            outline["slides"].append({
+                "slide_number": slide_num,
+                "title": section[:60],  # Limit title length
+                "content": content[:3],
+                "notes": f"Content sourced from {data['source']}",
+                "source": data['url']
+            })
+
+            slide_num += 1
+
+    # Fill remaining slides if needed
+    while len(outline["slides"]) < num_slides:
+        outline["slides"].append({
+            "slide_number": len(outline["slides"]) + 1,
+            "title": f"Additional Topic {len(outline['slides'])}",
+            "content": [
+                f"Further information about {topic}",
+                "Supporting details and examples",
+                "Key takeaways and insights"
+            ],
+            "notes": "Additional content",
+            "source": None
+        })
+
+    # Add conclusion slide
+    if len(outline["slides"]) < num_slides:
+        outline["slides"].append({
+            "slide_number": len(outline["slides"]) + 1,
+            "title": "Conclusion",
+            "content": [
+                f"Summary of key points about {topic}",
+                "Main takeaways and insights",
+                "Further resources and reading"
+            ],
+            "notes": "Conclusion slide",
+            "source": None
+        })
+
+    return outline
+
+def slide_key(slide):
+    """Identity of a generated slide, used to match it across regenerations"""
+    return (slide["title"], tuple(slide["content"]), slide.get("source"))
+
+def merge_outline_edits(new_outline, generated_outline, edited_outline):
+    """Carry user edits over to a regenerated outline
+
+    ``generated_outline`` is the outline as it was generated and
+    ``edited_outline`` the same outline after user edits. Slides of
+    ``new_outline`` that were also generated last time are replaced by their
+    edited version; all other slides are kept as generated. Edits to an
+    outline on a different topic are dropped.
+    """
+    if not generated_outline or not edited_outline or generated_outline["title"] != new_outline["title"]:
+        return new_outline
+
+    edits = {
+        slide_key(generated): edited
+        for generated, edited in zip(generated_outline["slides"], edited_outline["slides"])
+    }
+
+    merged = {
+        "title": new_outline["title"],
+        "slides": []
+    }
+    for slide in new_outline["slides"]:
+        edited = edits.get(slide_key(slide))
+        if edited is None:
+            merged["slides"].append(slide)
+        else:
+            merged["slides"].append({
+                **edited,
+                "content": list(edited["content"]),
+                "slide_number": slide["slide_number"]
+            })
+
+    return merged
+
+def enhance_presentation_content(outline):
+    """Enhance outline with better formatting"""
+    presentation = {
+        "title": outline["title"],
+        "slides": []
+    }
+
+    for slide in outline["slides"]:
+        enhanced_content = []
+        for point in slide["content"]:
+            # Clean up and format content
+            point = point.strip()
+            if not point.endswith('.'):
+                point += '.'
+            enhanced_content.append(point)
+
+        presentation["slides"].append({
+            "slide_number": slide["slide_number"],
+            "title": slide["title"],
+            "content": enhanced_content,
+            "notes": slide.get("notes", ""),
+            "source": slide.get("source")
+        })
+
+    return presentation
+
+def build_json_export(presentation, scraped_data):
+    """Serialize the presentation and its sources as JSON"""
+    # Add sources to export
+    export_data = presentation.copy()
+    export_data['sources'] = [
+        {'source': d['source'], 'url': d['url'], 'title': d.get('title', '')}
+        for d in scraped_data
+    ]
+
+    return json.dumps(export_data, indent=2)
+
+def build_text_export(presentation, scraped_data, date_label):
+    """Render the presentation and its sources as plain text"""
+    text_content = f"{presentation['title']}\n{'='*60}\n"
+    text_content += f"Generated from web research on {date_label}\n\n"
+
+    for slide in presentation['slides']:
+        text_content += f"\n{'='*60}\n"
+        text_content += f"Slide {slide['slide_number']}: {slide['title']}\n"
+        text_content += f"{'='*60}\n\n"
+        for point in slide['content']:
+            text_content += f"• {point}\n"
+        if slide.get('source'):
+            text_content += f"\nSource: {slide['source']}\n"
+        text_content += f"\nSpeaker Notes:\n{slide.get('notes', 'N/A')}\n"
+
+    text_content += f"\n{'='*60}\nSOURCES\n{'='*60}\n"
+    for idx, data in enumerate(scraped_data, 1):
+        text_content += f"{idx}. {data['source']} - {data['url']}\n"
+
+    return text_content
@@ -0,0 +1,199 @@
+"""
+Speculative prefetch while the topic is being typed.
+
+Once the topic has stayed unchanged for ``PREFETCH_DEBOUNCE`` seconds, the
+Wikipedia page and the search results for it are fetched in the background,
+so that by the time "Scrape Web & Generate Outline" is clicked most of the
+network latency has already been paid. A newer topic cancels the pending
+prefetch of an older one.
+
+The debounce timer and the bounded prefetch cache are per session. The
+worker pool and the limits on speculative traffic are shared by all
+sessions of the server process.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import streamlit as st
+
+from .config import (
+    PREFETCH_BURST,
+    PREFETCH_CACHE_SIZE,
+    PREFETCH_DEBOUNCE,
+    PREFETCH_MAX_PENDING,
+    PREFETCH_MAX_WORKERS,
+    PREFETCH_REQUESTS_PER_MINUTE,
+    PREFETCH_SEARCH_RESULTS,
+)
+from .scraping import scrape_wikipedia, search_duckduckgo
+
+# Requests made by one prefetch: Wikipedia page and search results
+REQUESTS_PER_PREFETCH = 2
+
+
+class PrefetchPool:
+    """Worker pool for speculative requests with global traffic limits.
+
+    At most ``max_workers`` prefetches run at once and at most
+    ``max_pending`` wait for a worker. A token bucket caps the request rate.
+    Prefetches over any limit are dropped rather than delayed: speculation
+    is only worth it when it is cheap.
+    """
+
+    def __init__(self, max_workers, max_pending, requests_per_minute, burst):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prefetch")
+        self._lock = threading.Lock()
+        self._max_pending = max_pending
+        self._pending = 0
+        self._rate = requests_per_minute / 60
+        self._burst = burst
+        self._tokens = burst
+        self._refilled_at = time.monotonic()
+
+    def _take_tokens(self, count):
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._refilled_at) * self._rate)
+        self._refilled_at = now
+        if self._tokens < count:
+            return False
+        self._tokens -= count
+        return True
+
+    def submit(self, fn, *args):
+        """Run ``fn`` on a worker, or return None if over a traffic limit"""
+        with self._lock:
+            if self._pending >= self._max_pending or not self._take_tokens(REQUESTS_PER_PREFETCH):
+                return None
+            self._pending += 1
+
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, future):
+        with self._lock:
+            self._pending -= 1
+
+
+@st.cache_resource(show_spinner=False)
+def get_prefetch_pool():
+    """Prefetch pool shared by all sessions, created once per server process"""
+    return PrefetchPool(
+        PREFETCH_MAX_WORKERS,
+        PREFETCH_MAX_PENDING,
+        PREFETCH_REQUESTS_PER_MINUTE,
+        PREFETCH_BURST
+    )
+
+
+class SessionPrefetcher:
+    """Prefetch state of one session.
+
+    Holds the debounce timer and the in-flight prefetch for the latest
+    topic, and a cache of the last ``PREFETCH_CACHE_SIZE`` prefetched topics.
+    It is kept in session state and written to from worker threads, so all
+    state is guarded by a lock.
+    """
+
+    def __init__(self, pool, max_entries=PREFETCH_CACHE_SIZE, debounce=PREFETCH_DEBOUNCE):
+        self._pool = pool
+        self._max_entries = max_entries
+        self._debounce = debounce
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()  # topic -> prefetched results
+        self._topic = None
+        self._timer = None
+        self._cancelled = None
+        self._future = None
+
+    def schedule(self, topic):
+        """Prefetch ``topic`` once it has been stable for the debounce window"""
+        with self._lock:
+            if topic == self._topic or topic in self._cache:
+                return
+            self._cancel_locked()
+
+            cancelled = threading.Event()
+            self._topic = topic
+            self._cancelled = cancelled
+            self._timer = threading.Timer(self._debounce, self._start, args=(topic, cancelled))
+            self._timer.daemon = True
+            self._timer.start()
+
+    def cancel(self):
+        """Cancel the pending or in-flight prefetch, if any"""
+        with self._lock:
+            self._cancel_locked()
+
+    def _cancel_locked(self):
+        if self._timer is not None:
+            self._timer.cancel()
+        if self._future is not None:
+            # Frees the pool slot of a prefetch that has not started yet
+            self._future.cancel()
+        if self._cancelled is not None:
+            self._cancelled.set()
+        self._topic = None
+        self._timer = None
+        self._cancelled = None
+        self._future = None
+
+    def _start(self, topic, cancelled):
+        """Debounce window elapsed: hand the prefetch to the shared pool"""
+        with self._lock:
+            if cancelled.is_set():
+                return
+            self._timer = None
+            self._future = self._pool.submit(self._fetch, topic, cancelled)
+
+    def _fetch(self, topic, cancelled):
+        if cancelled.is_set():
+            return
+
+        wikipedia = scrape_wikipedia(topic, warn=False)
+        if cancelled.is_set():
+            return
+        search_results = search_duckduckgo(topic, num_results=PREFETCH_SEARCH_RESULTS, warn=False)
+
+        with self._lock:
+            if cancelled.is_set():
+                return
+            self._cache[topic] = {
+                'wikipedia': wikipedia,
+                'search_results': search_results,
+                'search_limit': PREFETCH_SEARCH_RESULTS
+            }
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+
+    def take(self, topic, timeout):
+        """Prefetched results for ``topic``, or None.
+
+        Waits up to ``timeout`` seconds for a prefetch of ``topic`` that is
+        already fetching. One that is still in its debounce window or queued
+        behind other sessions' prefetches is cancelled, as the caller is
+        about to fetch the topic itself.
+        """
+        with self._lock:
+            future = None
+            if topic == self._topic:
+                if self._future is not None and not self._future.cancel():
+                    future = self._future
+                else:
+                    self._cancel_locked()
+
+        if future is not None:
+            wait([future], timeout=timeout)
+
+        with self._lock:
+            return self._cache.pop(topic, None)
+
+
+def get_session_prefetcher():
+    """Prefetcher of the current session, created on first use"""
+    if 'prefetcher' not in st.session_state:
+        st.session_state.prefetcher = SessionPrefetcher(get_prefetch_pool())
+    return st.session_state.prefetcher
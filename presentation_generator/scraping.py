@@ -0,0 +1,338 @@
+"""
+Web scraping for the presentation generator
+"""
+
+import time
+from urllib.parse import quote_plus, urlparse
+
+import requests
+import streamlit as st
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from .config import (
+    CITATION_RE,
+    CONTENT_CLASS_RE,
+    DUCKDUCKGO_SEARCH_URL,
+    REQUEST_HEADERS,
+    REQUEST_TIMEOUT,
+    SCRAPE_DELAY,
+    WIKIPEDIA_BASE_URL,
+)
+
+
+@st.cache_resource(show_spinner=False)
+def get_http_adapter():
+    """Shared connection pool, created once per server process.
+
+    Reusing one pool keeps connections to Wikipedia and DuckDuckGo alive
+    across scraping runs and across user sessions.
+    """
+    return HTTPAdapter(pool_connections=20, pool_maxsize=20)
+
+def new_http_session():
+    """HTTP session on top of the shared connection pool.
+
+    Sessions are not shared: a ``requests.Session`` is not guaranteed to be
+    thread-safe and its cookie jar would leak cookies between users. Do not
+    close it, as that would close the shared pool.
+    """
+    session = requests.Session()
+    session.headers.update(REQUEST_HEADERS)
+    adapter = get_http_adapter()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def is_definitive_miss(status_code):
+    """Whether an HTTP status means the page will not be there on a retry either.
+
+    Client errors such as 404 (no such article) or 403 (scraping blocked) are
+    definitive, except for those that ask the client to try again later.
+    Server errors are transient.
+    """
+    return 400 <= status_code < 500 and status_code not in (408, 429)
+
+def search_duckduckgo(query, num_results=5, warn=True):
+    """Search DuckDuckGo for relevant URLs
+
+    Errors are shown as a Streamlit warning unless ``warn`` is False.
+    """
+    try:
+        search_url = f"{DUCKDUCKGO_SEARCH_URL}?q={quote_plus(query)}"
+        response = new_http_session().get(search_url, timeout=REQUEST_TIMEOUT)
+
+        if response.status_code == 200:
+            soup = BeautifulSoup(response.content, 'html.parser')
+            results = []
+
+            for result in soup.find_all('a', class_='result__a', limit=num_results):
+                url = result.get('href')
+                title = result.get_text()
+                if url and title:
+                    results.append({
+                        'title': title,
+                        'url': url
+                    })
+
+            return results
+
+        return []
+    except Exception as e:
+        if warn:
+            st.warning(f"Search error: {str(e)}")
+        return []
+
+def scrape_wikipedia(topic, warn=True):
+    """Scrape Wikipedia for topic information
+
+    Returns False if there is no article for the topic and None if the
+    request failed in a way that may not happen again. Errors are shown as a
+    Streamlit warning unless ``warn`` is False.
+    """
+    try:
+        # Format topic for Wikipedia URL
+        topic_formatted = topic.replace(' ', '_')
+        url = f"{WIKIPEDIA_BASE_URL}{topic_formatted}"
+
+        response = new_http_session().get(url, timeout=REQUEST_TIMEOUT)
+
+        if response.status_code == 200:
+            soup = BeautifulSoup(response.content, 'html.parser')
+
+            # Get title
+            title = soup.find('h1', class_='firstHeading')
+            title_text = title.get_text() if title else topic
+
+            # Get introduction paragraphs
+            content = soup.find('div', class_='mw-parser-output')
+            paragraphs = []
+
+            if content:
+                for p in content.find_all('p', limit=5):
+                    text = p.get_text().strip()
+                    if len(text) > 50:  # Skip very short paragraphs
+                        # Clean up citation references
+                        text = CITATION_RE.sub('', text)
+                        paragraphs.append(text)
+
+            # Get section headings
+            sections = []
+            for heading in soup.find_all(['h2', 'h3'], limit=10):
+                section_text = heading.get_text()
+                # Clean up edit links
+                section_text = section_text.replace('[edit]', '').strip()
+                if section_text and len(section_text) > 3:
+                    sections.append(section_text)
+
+            return {
+                'source': 'Wikipedia',
+                'url': url,
+                'title': title_text,
+                'paragraphs': paragraphs,
+                'sections': sections
+            }
+
+        return False if is_definitive_miss(response.status_code) else None
+    except Exception as e:
+        if warn:
+            st.warning(f"Wikipedia scraping error: {str(e)}")
+        return None
+
+def scrape_website(url):
+    """Scrape content from a general website
+
+    Returns False if the site answered with a definitive client error, such
+    as a blocked scraper, and None if the request failed in a way that may
+    not happen again.
+    """
+    try:
+        response = new_http_session().get(url, timeout=REQUEST_TIMEOUT)
+
+        if response.status_code == 200:
+            soup = BeautifulSoup(response.content, 'html.parser')
+
+            # Remove script and style elements
+            for script in soup(["script", "style", "nav", "footer", "header"]):
+                script.decompose()
+
+            # Get title
+            title = soup.find('title')
+            title_text = title.get_text() if title else "Untitled"
+
+            # Get main content
+            paragraphs = []
+
+            # Try to find main content area
+            main_content = soup.find('main') or soup.find('article') or soup.find('div', class_=CONTENT_CLASS_RE)
+
+            if main_content:
+                for p in main_content.find_all('p', limit=10):
+                    text = p.get_text().strip()
+                    if len(text) > 50:
+                        paragraphs.append(text)
+            else:
+                # Fallback to all paragraphs
+                for p in soup.find_all('p', limit=10):
+                    text = p.get_text().strip()
+                    if len(text) > 50:
+                        paragraphs.append(text)
+
+            # Get headings
+            headings = []
+            for heading in soup.find_all(['h1', 'h2', 'h3'], limit=10):
+                heading_text = heading.get_text().strip()
+                if heading_text and len(heading_text) > 3:
+                    headings.append(heading_text)
+
+            return {
+                'source': urlparse(url).netloc,
+                'url': url,
+                'title': title_text,
+                'paragraphs': paragraphs,
+                'headings': headings
+            }
+
+        return False if is_definitive_miss(response.status_code) else None
+    except Exception as e:
+        st.warning(f"Error scraping {url}: {str(e)}")
+        return None
+
+def new_corpus(topic):
+    """Empty scraped corpus for a topic.
+
+    A corpus keeps everything fetched for one topic so that later runs with
+    different settings only fetch what is missing. Definitive misses (no
+    Wikipedia article, a site blocking scrapers) are recorded so they are
+    not requested again; transient failures are not recorded, so they are
+    retried on the next run. ``version`` is bumped
+    whenever new content is merged in, so an outline built from an
+    unchanged corpus can be reused.
+    """
+    return {
+        'topic': topic,
+        'version': 0,
+        'wikipedia': None,
+        'wikipedia_fetched': False,
+        'search_results': [],
+        'search_limit': 0,
+        'pages': {},  # url -> scraped page
+        'failed_urls': set()  # urls that will not yield a page
+    }
+
+def corpus_sources(corpus, num_sources):
+    """Scraped sources of a corpus, as used for ``num_sources`` web results"""
+    scraped_data = []
+    if corpus['wikipedia']:
+        scraped_data.append(corpus['wikipedia'])
+
+    for result in corpus['search_results'][:num_sources]:
+        scraped = corpus['pages'].get(result['url'])
+        if scraped and scraped['paragraphs']:
+            scraped_data.append(scraped)
+
+    return scraped_data
+
+def needs_search(corpus, num_sources):
+    """Whether the corpus holds fewer search results than ``num_sources`` asks for.
+
+    A search that returned fewer results than its limit has returned
+    everything there is, so it is not repeated.
+    """
+    return corpus['search_limit'] < num_sources and len(corpus['search_results']) >= corpus['search_limit']
+
+def missing_sources(corpus, num_sources):
+    """Whether ``scrape_web_for_topic`` would fetch anything for this corpus"""
+    if not corpus['wikipedia_fetched'] or needs_search(corpus, num_sources):
+        return True
+    return bool(pending_pages(corpus, num_sources))
+
+def pending_pages(corpus, num_sources):
+    """Search results for ``num_sources`` neither scraped nor definitively missed"""
+    return [
+        result for result in corpus['search_results'][:num_sources]
+        if result['url'] not in corpus['pages'] and result['url'] not in corpus['failed_urls']
+    ]
+
+def merge_prefetched(corpus, prefetched):
+    """Merge speculatively prefetched results (see prefetch.py) into a corpus"""
+    if not prefetched:
+        return
+
+    merged = False
+    # A transiently failed prefetch is left for the foreground run to retry
+    if not corpus['wikipedia_fetched'] and prefetched['wikipedia'] is not None:
+        corpus['wikipedia_fetched'] = True
+        if prefetched['wikipedia']:
+            corpus['wikipedia'] = prefetched['wikipedia']
+            merged = True
+    if prefetched['search_results'] and prefetched['search_limit'] > corpus['search_limit']:
+        corpus['search_results'] = prefetched['search_results']
+        corpus['search_limit'] = prefetched['search_limit']
+        merged = True
+
+    if merged:
+        corpus['version'] += 1
+
+def scrape_web_for_topic(topic, num_sources=3, corpus=None):
+    """Scrape web for topic information
+
+    Pass the corpus of an earlier run for the same topic to fetch only the
+    sources it is missing; it is updated in place.
+    """
+    if corpus is None:
+        corpus = new_corpus(topic)
+
+    if not missing_sources(corpus, num_sources):
+        return corpus_sources(corpus, num_sources)
+
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+
+    version = corpus['version']
+
+    # Try Wikipedia first
+    if not corpus['wikipedia_fetched']:
+        status_text.text("🔍 Searching Wikipedia...")
+        progress_bar.progress(20)
+        wiki_data = scrape_wikipedia(topic)
+        if wiki_data is not None:
+            corpus['wikipedia_fetched'] = True
+        if wiki_data:
+            corpus['wikipedia'] = wiki_data
+            corpus['version'] = version + 1
+
+    # Search for additional sources
+    if needs_search(corpus, num_sources):
+        status_text.text("🔍 Searching the web...")
+        progress_bar.progress(40)
+        search_results = search_duckduckgo(topic, num_results=num_sources)
+        # An empty result is usually a failed search, so leave it to be retried
+        if search_results:
+            corpus['search_results'] = search_results
+            corpus['search_limit'] = num_sources
+            corpus['version'] = version + 1
+
+    # Scrape search results not scraped yet
+    pending = pending_pages(corpus, num_sources)
+    for idx, result in enumerate(pending):
+        status_text.text(f"📄 Scraping {idx + 1}/{len(pending)}...")
+        progress_bar.progress(40 + (idx + 1) * 60 // len(pending))
+
+        scraped = scrape_website(result['url'])
+        if scraped is False:
+            corpus['failed_urls'].add(result['url'])
+        elif scraped:
+            corpus['pages'][result['url']] = scraped
+            corpus['version'] = version + 1
+
+        time.sleep(SCRAPE_DELAY)  # Be nice to servers
+
+    progress_bar.progress(100)
+    status_text.text("✅ Web scraping complete!")
+    time.sleep(SCRAPE_DELAY)
+    status_text.empty()
+    progress_bar.empty()
+
+    return corpus_sources(corpus, num_sources)
@@ -0,0 +1,425 @@
+"""
+Streamlit UI for the presentation generator.
+
+Each rerun only renders the sidebar and main area of the current
+``generation_step``. Anything that depends solely on a step transition
+(the final presentation, its exports and title slide) is computed once in the
+button handler that performs the transition and kept in session state.
+"""
+
+import copy
+from datetime import datetime
+
+import streamlit as st
+
+from .config import (
+    CORPUS_CACHE_SIZE,
+    CUSTOM_CSS,
+    FEATURES_MARKDOWN,
+    HOW_IT_WORKS_MARKDOWN,
+    IMPORTANT_NOTES_MARKDOWN,
+    PAGE_STYLES,
+    PREFETCH_WAIT_TIMEOUT,
+    SESSION_DEFAULTS,
+    THEME_NAMES,
+    THEMES,
+)
+from .outline import (
+    build_json_export,
+    build_text_export,
+    enhance_presentation_content,
+    generate_outline_from_web,
+    merge_outline_edits,
+)
+from .prefetch import get_session_prefetcher
+from .scraping import merge_prefetched, missing_sources, new_corpus, scrape_web_for_topic
+
+# Theme previews never change, so render them once
+THEME_PREVIEW_HTML = {
+    name: f"""
+            <div style="padding: 10px; background-color: {theme_config['background']}; border: 2px solid {theme_config['primary_color']}; border-radius: 5px;">
+                <p style="color: {theme_config['primary_color']}; font-weight: bold;">Primary</p>
+                <p style="color: {theme_config['secondary_color']}; font-weight: bold;">Secondary</p>
+                <p style="color: {theme_config['text_color']};">Text</p>
+            </div>
+            """
+    for name, theme_config in THEMES.items()
+}
+
+
+def init_session_state():
+    """Populate session state defaults on the first run of a session"""
+    if st.session_state.get('_initialized'):
+        return
+
+    for key, value in SESSION_DEFAULTS.items():
+        if key not in st.session_state:
+            st.session_state[key] = copy.copy(value)
+    st.session_state._initialized = True
+
+def reset_session_state():
+    """Discard the current presentation and go back to the input step"""
+    for key, value in SESSION_DEFAULTS.items():
+        if key not in ('selected_theme', 'corpora'):
+            st.session_state[key] = copy.copy(value)
+
+def get_corpus(topic):
+    """Scraped corpus for a topic, created on first use.
+
+    Only the ``CORPUS_CACHE_SIZE`` most recently used topics are kept.
+    """
+    corpora = st.session_state.corpora
+    if topic in corpora:
+        # Move to the end, as most recently used
+        corpora[topic] = corpora.pop(topic)
+    else:
+        corpora[topic] = new_corpus(topic)
+        while len(corpora) > CORPUS_CACHE_SIZE:
+            del corpora[next(iter(corpora))]
+    return corpora[topic]
+
+def build_outline(topic, num_slides, num_sources, corpus, scraped_data):
+    """Generate the outline, keeping user edits to slides that did not change
+
+    Nothing is regenerated if the corpus version and the settings the
+    outline depends on are the same as for the current outline.
+    """
+    outline_key = (topic, corpus['version'], num_sources, num_slides)
+    if st.session_state.outline and outline_key == st.session_state.outline_key:
+        return
+    st.session_state.outline_key = outline_key
+
+    outline = generate_outline_from_web(topic, num_slides, scraped_data)
+
+    edited = merge_outline_edits(outline, st.session_state.generated_outline, st.session_state.outline)
+
+    # Keep a pristine copy; the outline editor mutates slides in place
+    st.session_state.generated_outline = copy.deepcopy(outline)
+    st.session_state.outline = edited
+    st.session_state.scraped_data = scraped_data
+
+def apply_pending_edits():
+    """Copy the outline editor's widget values into the outline.
+
+    ``render_outline_main`` does this on every rerun, but a sidebar button
+    that changes step reruns before the main area is rendered. Such a button
+    must call this first, or the edits made in the same rerun are lost.
+    """
+    for idx, slide in enumerate(st.session_state.outline['slides']):
+        if f"title_{idx}" in st.session_state:
+            slide['title'] = st.session_state[f"title_{idx}"]
+        slide['content'] = [
+            st.session_state.get(f"point_{idx}_{point_idx}", point)
+            for point_idx, point in enumerate(slide['content'])
+        ]
+        if f"notes_{idx}" in st.session_state:
+            slide['notes'] = st.session_state[f"notes_{idx}"]
+
+def render_title_slide_html(title, theme_config, date_label):
+    """Build the HTML for the title slide"""
+    return f"""
+            <div style="text-align: center; padding: 60px; background: linear-gradient(135deg, {theme_config['primary_color']}, {theme_config['secondary_color']}); color: white; border-radius: 10px; margin-bottom: 20px;">
+                <h1 style="font-size: 3rem; margin-bottom: 20px;">{title}</h1>
+                <p style="font-size: 1.2rem;">Generated from web research on {date_label}</p>
+            </div>
+            """
+
+def build_presentation():
+    """Turn the current outline into the final presentation and its exports"""
+    presentation = enhance_presentation_content(st.session_state.outline)
+    scraped_data = st.session_state.scraped_data
+    date_label = datetime.now().strftime('%B %d, %Y')
+
+    st.session_state.presentation = presentation
+    st.session_state.title_slide_html = render_title_slide_html(
+        presentation['title'], THEMES[st.session_state.selected_theme], date_label
+    )
+    st.session_state.export_json = build_json_export(presentation, scraped_data)
+    st.session_state.export_text = build_text_export(presentation, scraped_data, date_label)
+
+def display_slide(slide, theme_config, index):
+    """Display a single slide"""
+    st.markdown(f"""
+    <div class="slide-container" style="background-color: {theme_config['background']}; border-color: {theme_config['primary_color']};">
+        <div class="slide-title" style="color: {theme_config['primary_color']};">
+            Slide {slide['slide_number']}: {slide['title']}
+        </div>
+        <div class="slide-content" style="color: {theme_config['text_color']};">
+    """, unsafe_allow_html=True)
+
+    for point in slide['content']:
+        st.markdown(f"• {point}")
+
+    if slide.get('source'):
+        st.markdown(f'<p class="source-link">📎 Source: <a href="{slide["source"]}" target="_blank">{slide["source"][:50]}...</a></p>', unsafe_allow_html=True)
+
+    st.markdown("</div></div>", unsafe_allow_html=True)
+
+    with st.expander("📝 Speaker Notes"):
+        st.write(slide.get('notes', 'No notes available'))
+
+def render_input_sidebar():
+    st.header("📋 Presentation Settings")
+
+    settings = st.session_state.settings
+
+    topic = st.text_input(
+        "Topic",
+        value=settings['topic'],
+        placeholder="e.g., Artificial Intelligence",
+        help="Enter any topic - we'll search the web for information"
+    )
+
+    num_slides = st.slider("Number of Slides", min_value=5, max_value=12, value=settings['num_slides'])
+
+    num_sources = st.slider(
+        "Number of Sources to Scrape",
+        min_value=2,
+        max_value=5,
+        value=settings['num_sources'],
+        help="More sources = better content but slower"
+    )
+
+    page_style = st.selectbox(
+        "Page Style",
+        PAGE_STYLES,
+        index=PAGE_STYLES.index(settings['page_style'])
+    )
+
+    prefetch = st.checkbox(
+        "⚡ Prefetch while typing",
+        value=settings['prefetch'],
+        help="Start searching as soon as the topic stops changing, before the button is clicked"
+    )
+
+    st.markdown("---")
+
+    corpus = st.session_state.corpora.get(topic.strip())
+    if prefetch and topic.strip() and not (corpus and corpus['wikipedia_fetched']):
+        get_session_prefetcher().schedule(topic.strip())
+    elif 'prefetcher' in st.session_state:
+        st.session_state.prefetcher.cancel()
+
+    if corpus and not missing_sources(corpus, num_sources):
+        st.info("⚡ Content for this topic is already scraped - no waiting")
+    else:
+        st.warning("⏱️ Scraping may take 10-30 seconds depending on sources")
+
+    if st.button("🚀 Scrape Web & Generate Outline"):
+        if not topic or not topic.strip():
+            st.error("⚠️ Please enter a topic")
+        else:
+            topic = topic.strip()
+            st.session_state.settings = {
+                'topic': topic,
+                'num_slides': num_slides,
+                'num_sources': num_sources,
+                'page_style': page_style,
+                'prefetch': prefetch
+            }
+
+            corpus = get_corpus(topic)
+            if prefetch:
+                # Past the timeout the prefetch is left running and the
+                # topic is fetched in the foreground below
+                with st.spinner("⚡ Finishing prefetch..."):
+                    prefetched = get_session_prefetcher().take(topic, PREFETCH_WAIT_TIMEOUT)
+                merge_prefetched(corpus, prefetched)
+
+            # Scrape web, fetching only what earlier runs for this topic did not
+            scraped_data = scrape_web_for_topic(topic, num_sources, corpus)
+
+            if not scraped_data:
+                st.error("❌ Could not scrape any content. Try a different topic.")
+            else:
+                st.success(f"✅ Scraped {len(scraped_data)} sources!")
+
+                # Generate outline
+                with st.spinner("Creating outline..."):
+                    build_outline(topic, num_slides, num_sources, corpus, scraped_data)
+                    st.session_state.generation_step = 'outline'
+                    st.rerun()
+
+def render_outline_sidebar():
+    st.header("🎨 Theme Selection")
+    selected_theme = st.selectbox("Choose Theme", THEME_NAMES)
+    st.session_state.selected_theme = selected_theme
+
+    # Theme preview
+    st.markdown(THEME_PREVIEW_HTML[selected_theme], unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    if st.button("✨ Generate Presentation"):
+        apply_pending_edits()
+        with st.spinner("Creating presentation..."):
+            build_presentation()
+            st.session_state.generation_step = 'presentation'
+            st.success("✅ Presentation ready!")
+            st.rerun()
+
+    if st.button("← Back to Settings"):
+        apply_pending_edits()
+        st.session_state.generation_step = 'input'
+        st.rerun()
+
+def render_presentation_sidebar():
+    st.success("✅ Presentation Ready!")
+
+    # Show sources
+    if st.session_state.scraped_data:
+        with st.expander("📚 Sources Used"):
+            for data in st.session_state.scraped_data:
+                st.write(f"**{data['source']}**")
+                st.write(f"🔗 [{data['url'][:40]}...]({data['url']})")
+
+    if st.button("🔄 Create New"):
+        reset_session_state()
+        st.rerun()
+
+    if st.button("← Edit Outline"):
+        st.session_state.generation_step = 'outline'
+        st.rerun()
+
+def render_input_main():
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        st.markdown("### 🌟 Features")
+        st.markdown(FEATURES_MARKDOWN)
+
+        st.markdown("### 📝 How It Works")
+        st.markdown(HOW_IT_WORKS_MARKDOWN)
+
+        st.markdown("### ⚠️ Important Notes")
+        st.markdown(IMPORTANT_NOTES_MARKDOWN)
+
+def render_outline_main():
+    st.header("📝 Review & Edit Outline")
+
+    if st.session_state.outline:
+        st.markdown(f"### {st.session_state.outline['title']}")
+
+        # Show scraped sources
+        if st.session_state.scraped_data:
+            with st.expander("📚 Content Sources", expanded=True):
+                for data in st.session_state.scraped_data:
+                    st.write(f"✅ **{data['source']}** - {data.get('title', 'No title')}")
+                    st.caption(f"🔗 {data['url']}")
+
+        edited_outline = st.session_state.outline.copy()
+
+        for idx, slide in enumerate(st.session_state.outline['slides']):
+            with st.expander(f"Slide {slide['slide_number']}: {slide['title']}", expanded=idx < 3):
+                new_title = st.text_input("Title", value=slide['title'], key=f"title_{idx}")
+                edited_outline['slides'][idx]['title'] = new_title
+
+                st.write("**Content Points:**")
+                new_content = []
+                for point_idx, point in enumerate(slide['content']):
+                    new_point = st.text_area(
+                        f"Point {point_idx + 1}",
+                        value=point,
+                        key=f"point_{idx}_{point_idx}",
+                        height=80
+                    )
+                    new_content.append(new_point)
+
+                edited_outline['slides'][idx]['content'] = new_content
+
+                new_notes = st.text_area(
+                    "Speaker Notes",
+                    value=slide.get('notes', ''),
+                    key=f"notes_{idx}",
+                    height=60
+                )
+                edited_outline['slides'][idx]['notes'] = new_notes
+
+                if slide.get('source'):
+                    st.caption(f"📎 Source: {slide['source']}")
+
+        st.session_state.outline = edited_outline
+
+def render_presentation_main():
+    if st.session_state.presentation:
+        st.header("🎉 Your Presentation")
+
+        theme_config = THEMES[st.session_state.selected_theme]
+
+        # Title slide
+        st.markdown(st.session_state.title_slide_html, unsafe_allow_html=True)
+
+        # Display slides
+        for idx, slide in enumerate(st.session_state.presentation['slides']):
+            display_slide(slide, theme_config, idx)
+
+        # Sources
+        st.markdown("---")
+        st.header("📚 Sources & Citations")
+        if st.session_state.scraped_data:
+            for idx, data in enumerate(st.session_state.scraped_data, 1):
+                st.write(f"{idx}. **{data['source']}** - {data.get('title', 'No title')}")
+                st.write(f"   🔗 {data['url']}")
+
+        # Export options
+        st.markdown("---")
+        st.header("📥 Export Options")
+
+        col1, col2, col3 = st.columns(3)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+        with col1:
+            st.download_button(
+                label="📄 Download JSON",
+                data=st.session_state.export_json,
+                file_name=f"presentation_webscrape_{timestamp}.json",
+                mime="application/json"
+            )
+
+        with col2:
+            st.download_button(
+                label="📝 Download Text",
+                data=st.session_state.export_text,
+                file_name=f"presentation_webscrape_{timestamp}.txt",
+                mime="text/plain"
+            )
+
+        with col3:
+            st.info("💡 PowerPoint export coming soon!")
+
+SIDEBAR_RENDERERS = {
+    'input': render_input_sidebar,
+    'outline': render_outline_sidebar,
+    'presentation': render_presentation_sidebar
+}
+
+MAIN_RENDERERS = {
+    'input': render_input_main,
+    'outline': render_outline_main,
+    'presentation': render_presentation_main
+}
+
+def main():
+    init_session_state()
+
+    # Custom CSS
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+    # Header
+    st.markdown('<h1 class="main-header">🌐 Presentation Generator - Web Scraping</h1>', unsafe_allow_html=True)
+
+    st.info("✨ This version generates presentations using REAL content from the web!")
+
+    step = st.session_state.generation_step
+
+    # Sidebar
+    with st.sidebar:
+        st.header("⚙️ Configuration")
+
+        st.success("✅ No API key needed!")
+        st.info("🌐 Uses web scraping for content")
+        st.markdown("---")
+
+        SIDEBAR_RENDERERS[step]()
+
+    # Main content
+    MAIN_RENDERERS[step]()
@@ -0,0 +1,113 @@
+"""
+Tests for keeping user edits across outline regenerations
+"""
+
+import copy
+
+import pytest
+
+from presentation_generator import ui
+from presentation_generator.config import SESSION_DEFAULTS
+from presentation_generator.outline import generate_outline_from_web, merge_outline_edits
+
+TOPIC = "Climate Change"
+
+PARAGRAPH = (
+    "Climate change is the long-term shift in temperatures and weather patterns. "
+    "Such shifts can be natural, due to changes in the sun's activity. "
+    "Since the 1800s human activities have been the main driver of climate change."
+)
+
+
+def scraped_data():
+    return [{
+        'source': 'Wikipedia',
+        'url': 'https://en.wikipedia.org/wiki/Climate_change',
+        'title': TOPIC,
+        'paragraphs': [PARAGRAPH] * 3,
+        'sections': [f"Section {n}" for n in range(12)]
+    }]
+
+def slide(number, title, source=None):
+    return {
+        'slide_number': number,
+        'title': title,
+        'content': [f"{title} point {n}" for n in range(3)],
+        'notes': f"{title} notes",
+        'source': source
+    }
+
+def edit(outline, idx, title):
+    edited = copy.deepcopy(outline)
+    edited['slides'][idx]['title'] = title
+    edited['slides'][idx]['content'][0] = f"{title} point"
+    edited['slides'][idx]['notes'] = f"{title} notes"
+    return edited
+
+
+class SessionState(dict):
+    """Stand-in for ``st.session_state``, with attribute and item access"""
+
+    __getattr__ = dict.__getitem__
+    __setattr__ = dict.__setitem__
+
+
+@pytest.fixture
+def session_state(monkeypatch):
+    state = SessionState(copy.deepcopy(SESSION_DEFAULTS))
+    monkeypatch.setattr(ui.st, 'session_state', state)
+    return state
+
+
+def test_edited_slide_survives_slide_count_change():
+    generated = generate_outline_from_web(TOPIC, 8, scraped_data())
+    edited = edit(generated, 2, "My title")
+
+    merged = merge_outline_edits(generate_outline_from_web(TOPIC, 12, scraped_data()), generated, edited)
+
+    assert len(merged['slides']) == 12
+    assert merged['slides'][2] == edited['slides'][2]
+    assert merged['slides'][8]['title'] == "Section 7"
+
+def test_edited_slide_is_renumbered():
+    generated = {'title': TOPIC, 'slides': [slide(1, "Introduction"), slide(2, "History"), slide(3, "Effects")]}
+    edited = edit(generated, 2, "What changes")
+    new_outline = {'title': TOPIC, 'slides': [slide(1, "Introduction"), slide(2, "Effects")]}
+
+    merged = merge_outline_edits(new_outline, generated, edited)
+
+    assert [s['title'] for s in merged['slides']] == ["Introduction", "What changes"]
+    assert [s['slide_number'] for s in merged['slides']] == [1, 2]
+
+def test_changed_slide_is_regenerated():
+    generated = {'title': TOPIC, 'slides': [slide(1, "Introduction"), slide(2, "History")]}
+    edited = edit(generated, 1, "My history")
+    # Same title, but the source changed, so it is a different slide
+    new_outline = {'title': TOPIC, 'slides': [slide(1, "Introduction"), slide(2, "History", "https://example.com")]}
+
+    merged = merge_outline_edits(new_outline, generated, edited)
+
+    assert merged['slides'] == new_outline['slides']
+
+def test_edits_from_another_topic_are_dropped():
+    generated = {'title': "Weather", 'slides': [slide(1, "Introduction")]}
+    edited = edit(generated, 0, "My introduction")
+    new_outline = {'title': TOPIC, 'slides': [slide(1, "Introduction")]}
+
+    assert merge_outline_edits(new_outline, generated, edited) == new_outline
+
+def test_unchanged_corpus_keeps_the_outline(session_state):
+    corpus = {'version': 1}
+    ui.build_outline(TOPIC, 8, 3, corpus, scraped_data())
+    session_state.outline['slides'][0]['title'] = "My introduction"
+    outline = session_state.outline
+
+    ui.build_outline(TOPIC, 8, 3, corpus, scraped_data())
+    assert session_state.outline is outline
+
+    # New content is merged into a regenerated outline, keeping the edit
+    corpus['version'] = 2
+    ui.build_outline(TOPIC, 8, 3, corpus, scraped_data())
+    assert session_state.outline is not outline
+    assert session_state.outline['slides'][0]['title'] == "My introduction"
+    assert session_state.generated_outline['slides'][0]['title'] == "Introduction"
@@ -0,0 +1,190 @@
+"""
+Tests for the speculative prefetch pool and per-session prefetcher, with the
+network fetchers stubbed
+"""
+
+import threading
+import time
+
+import pytest
+
+from presentation_generator import prefetch
+from presentation_generator.prefetch import PrefetchPool, SessionPrefetcher
+
+DEBOUNCE = 0.01
+
+
+def wait_until(predicate, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.005)
+
+
+class Fetchers:
+    """Stubbed fetchers recording every request made
+
+    Fetching a topic passed to ``block`` waits until it is released.
+    """
+
+    def __init__(self):
+        self.calls = []
+        self.started = {}
+        self.gates = {}
+
+    def block(self, topic):
+        self.started[topic] = threading.Event()
+        self.gates[topic] = threading.Event()
+
+    def release(self, topic):
+        self.gates[topic].set()
+
+    def scrape_wikipedia(self, topic, warn=True):
+        self.calls.append(('wikipedia', topic))
+        if topic in self.gates:
+            self.started[topic].set()
+            self.gates[topic].wait(timeout=5)
+        return {'title': topic}
+
+    def search_duckduckgo(self, query, num_results=5, warn=True):
+        self.calls.append(('search', query))
+        return [{'title': query, 'url': "https://example.com/0"}]
+
+    def topics(self):
+        return [topic for kind, topic in self.calls if kind == 'wikipedia']
+
+
+@pytest.fixture
+def fetchers(monkeypatch):
+    stub = Fetchers()
+    monkeypatch.setattr(prefetch, 'scrape_wikipedia', stub.scrape_wikipedia)
+    monkeypatch.setattr(prefetch, 'search_duckduckgo', stub.search_duckduckgo)
+    yield stub
+    for gate in stub.gates.values():
+        gate.set()
+
+
+def new_pool(max_workers=1, max_pending=8, requests_per_minute=6000, burst=100):
+    return PrefetchPool(max_workers, max_pending, requests_per_minute, burst)
+
+def occupy(pool):
+    """Keep the only worker of ``pool`` busy until the returned event is set"""
+    gate = threading.Event()
+    started = threading.Event()
+
+    def job():
+        started.set()
+        gate.wait(timeout=5)
+
+    assert pool.submit(job) is not None
+    started.wait(timeout=2)
+    return gate
+
+
+def test_submit_drops_work_over_max_pending():
+    pool = new_pool(max_pending=2)
+    gate = occupy(pool)
+
+    assert pool.submit(time.sleep, 0) is not None
+    assert pool.submit(time.sleep, 0) is None
+
+    gate.set()
+    wait_until(lambda: pool.submit(time.sleep, 0) is not None)
+
+def test_submit_drops_work_over_request_rate():
+    # The bucket holds one prefetch and refills far slower than the test runs
+    pool = new_pool(max_workers=4, requests_per_minute=0.01, burst=prefetch.REQUESTS_PER_PREFETCH)
+
+    assert pool.submit(time.sleep, 0) is not None
+    assert pool.submit(time.sleep, 0) is None
+
+def test_cancelled_future_frees_its_slot():
+    pool = new_pool(max_pending=2)
+    gate = occupy(pool)
+
+    queued = pool.submit(time.sleep, 0)
+    assert pool.submit(time.sleep, 0) is None
+    assert queued.cancel()
+    assert pool.submit(time.sleep, 0) is not None
+    gate.set()
+
+def test_new_topic_cancels_debounced_prefetch(fetchers):
+    prefetcher = SessionPrefetcher(new_pool(), debounce=0.2)
+    prefetcher.schedule("Climate")
+    prefetcher.schedule("Climate Change")
+
+    wait_until(lambda: fetchers.topics())
+    time.sleep(0.3)
+    assert fetchers.topics() == ["Climate Change"]
+    assert prefetcher.take("Climate Change", 2)['wikipedia'] == {'title': "Climate Change"}
+
+def test_new_topic_cancels_queued_prefetch(fetchers):
+    pool = new_pool()
+    gate = occupy(pool)
+    prefetcher = SessionPrefetcher(pool, debounce=DEBOUNCE)
+
+    prefetcher.schedule("Climate")
+    time.sleep(0.1)
+    assert pool._pending == 2
+    prefetcher.schedule("Climate Change")
+    assert pool._pending == 1  # The queued prefetch of the old topic gave its slot back
+    gate.set()
+
+    wait_until(lambda: fetchers.topics())
+    time.sleep(0.1)
+    assert fetchers.topics() == ["Climate Change"]
+
+def test_result_of_cancelled_prefetch_is_dropped(fetchers):
+    fetchers.block("Climate")
+    prefetcher = SessionPrefetcher(new_pool(max_workers=2), debounce=DEBOUNCE)
+
+    prefetcher.schedule("Climate")
+    assert fetchers.started["Climate"].wait(timeout=2)
+    prefetcher.schedule("Climate Change")
+    fetchers.release("Climate")
+
+    wait_until(lambda: ('search', "Climate Change") in fetchers.calls)
+    time.sleep(0.1)
+    assert prefetcher.take("Climate Change", 2) is not None
+    assert prefetcher.take("Climate", 0) is None
+    assert ('search', "Climate") not in fetchers.calls
+
+def test_take_cancels_queued_prefetch(fetchers):
+    pool = new_pool(max_pending=2)
+    gate = occupy(pool)
+    prefetcher = SessionPrefetcher(pool, debounce=DEBOUNCE)
+
+    prefetcher.schedule("Climate Change")
+    time.sleep(0.1)
+    assert pool.submit(time.sleep, 0) is None  # The prefetch holds the last slot
+
+    start = time.monotonic()
+    assert prefetcher.take("Climate Change", 5) is None
+    assert time.monotonic() - start < 1
+
+    # The cancelled prefetch gave its slot back and never runs
+    assert pool.submit(time.sleep, 0) is not None
+    gate.set()
+    time.sleep(0.1)
+    assert fetchers.calls == []
+
+def test_take_cancels_debounced_prefetch(fetchers):
+    prefetcher = SessionPrefetcher(new_pool(), debounce=0.2)
+    prefetcher.schedule("Climate Change")
+
+    assert prefetcher.take("Climate Change", 5) is None
+    time.sleep(0.3)
+    assert fetchers.calls == []
+
+def test_take_waits_for_running_prefetch(fetchers):
+    fetchers.block("Climate Change")
+    prefetcher = SessionPrefetcher(new_pool(), debounce=DEBOUNCE)
+
+    prefetcher.schedule("Climate Change")
+    assert fetchers.started["Climate Change"].wait(timeout=2)
+    threading.Timer(0.1, fetchers.release, args=("Climate Change",)).start()
+
+    prefetched = prefetcher.take("Climate Change", 5)
+    assert prefetched['wikipedia'] == {'title': "Climate Change"}
+    assert prefetched['search_limit'] == prefetch.PREFETCH_SEARCH_RESULTS
@@ -0,0 +1,223 @@
+"""
+Tests for the incremental scraping corpus, with the network fetchers stubbed
+"""
+
+import pytest
+
+from presentation_generator import scraping
+from presentation_generator.scraping import (
+    corpus_sources,
+    merge_prefetched,
+    missing_sources,
+    needs_search,
+    new_corpus,
+    scrape_web_for_topic,
+    scrape_website,
+    scrape_wikipedia,
+)
+
+TOPIC = "Climate Change"
+
+
+def page(url):
+    return {
+        'source': 'example.com',
+        'url': url,
+        'title': url,
+        'paragraphs': ["A paragraph long enough to be kept as content for a slide."],
+        'headings': []
+    }
+
+def results(count):
+    return [{'title': f"Result {n}", 'url': f"https://example.com/{n}"} for n in range(count)]
+
+
+class Fetchers:
+    """Stubbed fetchers recording every request made
+
+    ``wikipedia`` is True for an article, None for a transient failure and
+    False for a missing article. ``failing_urls`` fail transiently and
+    ``missing_urls`` definitively.
+    """
+
+    def __init__(self, wikipedia=True, search=5, failing_urls=(), missing_urls=()):
+        self.wikipedia = wikipedia
+        self.search = search
+        self.failing_urls = set(failing_urls)
+        self.missing_urls = set(missing_urls)
+        self.calls = []
+
+    def scrape_wikipedia(self, topic):
+        self.calls.append(('wikipedia', topic))
+        return page("https://en.wikipedia.org/wiki/Climate_Change") if self.wikipedia is True else self.wikipedia
+
+    def search_duckduckgo(self, query, num_results=5):
+        self.calls.append(('search', num_results))
+        return results(min(self.search, num_results))
+
+    def scrape_website(self, url):
+        self.calls.append(('page', url))
+        if url in self.missing_urls:
+            return False
+        return None if url in self.failing_urls else page(url)
+
+
+class Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.content = b""
+
+
+class Session:
+    """Stubbed HTTP session answering every request with one status"""
+
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+    def get(self, url, timeout=None):
+        return Response(self.status_code)
+
+
+@pytest.fixture
+def fetchers(monkeypatch):
+    stub = Fetchers()
+    monkeypatch.setattr(scraping, 'scrape_wikipedia', stub.scrape_wikipedia)
+    monkeypatch.setattr(scraping, 'search_duckduckgo', stub.search_duckduckgo)
+    monkeypatch.setattr(scraping, 'scrape_website', stub.scrape_website)
+    monkeypatch.setattr(scraping, 'SCRAPE_DELAY', 0)
+    return stub
+
+
+def test_new_corpus_is_missing_everything():
+    corpus = new_corpus(TOPIC)
+    assert missing_sources(corpus, 3)
+    assert needs_search(corpus, 3)
+    assert corpus_sources(corpus, 3) == []
+
+def test_needs_search_only_when_more_results_could_exist():
+    corpus = new_corpus(TOPIC)
+    corpus['search_results'] = results(3)
+    corpus['search_limit'] = 3
+    assert not needs_search(corpus, 3)
+    assert not needs_search(corpus, 2)
+    assert needs_search(corpus, 5)
+
+    # A search that returned fewer results than asked for is exhausted
+    corpus['search_results'] = results(2)
+    assert not needs_search(corpus, 5)
+
+def test_missing_sources_checks_only_the_requested_results():
+    corpus = new_corpus(TOPIC)
+    corpus['wikipedia_fetched'] = True
+    corpus['search_results'] = results(5)
+    corpus['search_limit'] = 5
+    corpus['pages'] = {r['url']: page(r['url']) for r in results(3)}
+    assert not missing_sources(corpus, 3)
+    assert missing_sources(corpus, 4)
+
+def test_full_scrape(fetchers):
+    corpus = new_corpus(TOPIC)
+    scraped_data = scrape_web_for_topic(TOPIC, 3, corpus)
+
+    assert len(scraped_data) == 4
+    assert corpus['version'] == 1
+    assert not missing_sources(corpus, 3)
+
+def test_unchanged_settings_fetch_nothing(fetchers):
+    corpus = new_corpus(TOPIC)
+    scrape_web_for_topic(TOPIC, 3, corpus)
+    fetchers.calls.clear()
+
+    assert len(scrape_web_for_topic(TOPIC, 2, corpus)) == 3
+    assert len(scrape_web_for_topic(TOPIC, 3, corpus)) == 4
+    assert fetchers.calls == []
+    assert corpus['version'] == 1
+
+def test_more_sources_fetch_only_new_pages(fetchers):
+    corpus = new_corpus(TOPIC)
+    scrape_web_for_topic(TOPIC, 3, corpus)
+    fetchers.calls.clear()
+
+    assert len(scrape_web_for_topic(TOPIC, 5, corpus)) == 6
+    assert fetchers.calls == [
+        ('search', 5),
+        ('page', "https://example.com/3"),
+        ('page', "https://example.com/4")
+    ]
+    assert corpus['version'] == 2
+
+def test_failed_fetches_are_retried(fetchers):
+    fetchers.wikipedia = None
+    fetchers.search = 0
+    corpus = new_corpus(TOPIC)
+
+    assert scrape_web_for_topic(TOPIC, 3, corpus) == []
+    assert missing_sources(corpus, 3)
+    assert corpus['version'] == 0
+
+    # Services recover: the next run fetches everything
+    fetchers.wikipedia = True
+    fetchers.search = 5
+    fetchers.calls.clear()
+    assert len(scrape_web_for_topic(TOPIC, 3, corpus)) == 4
+    assert ('wikipedia', TOPIC) in fetchers.calls
+    assert ('search', 3) in fetchers.calls
+
+def test_failed_pages_are_retried(fetchers):
+    fetchers.failing_urls = {"https://example.com/1"}
+    corpus = new_corpus(TOPIC)
+
+    assert len(scrape_web_for_topic(TOPIC, 3, corpus)) == 3
+    assert missing_sources(corpus, 3)
+
+    fetchers.failing_urls = set()
+    fetchers.calls.clear()
+    assert len(scrape_web_for_topic(TOPIC, 3, corpus)) == 4
+    assert fetchers.calls == [('page', "https://example.com/1")]
+
+def test_missing_wikipedia_is_not_requested_again(fetchers):
+    fetchers.wikipedia = False
+    corpus = new_corpus(TOPIC)
+
+    assert len(scrape_web_for_topic(TOPIC, 3, corpus)) == 3
+    assert not missing_sources(corpus, 3)
+
+    # A slide-count change scrapes with the same sources again
+    fetchers.calls.clear()
+    assert len(scrape_web_for_topic(TOPIC, 3, corpus)) == 3
+    assert fetchers.calls == []
+
+def test_blocked_pages_are_not_requested_again(fetchers):
+    fetchers.missing_urls = {"https://example.com/1"}
+    corpus = new_corpus(TOPIC)
+
+    assert len(scrape_web_for_topic(TOPIC, 3, corpus)) == 3
+    assert not missing_sources(corpus, 3)
+
+    fetchers.calls.clear()
+    assert len(scrape_web_for_topic(TOPIC, 3, corpus)) == 3
+    assert fetchers.calls == []
+
+@pytest.mark.parametrize("status_code, expected", [(404, False), (403, False), (429, None), (503, None)])
+def test_client_errors_are_definitive_misses(monkeypatch, status_code, expected):
+    monkeypatch.setattr(scraping, 'new_http_session', lambda: Session(status_code))
+
+    assert scrape_wikipedia(TOPIC, warn=False) is expected
+    assert scrape_website("https://example.com/0") is expected
+
+def test_merge_prefetched_records_missing_wikipedia():
+    corpus = new_corpus(TOPIC)
+    merge_prefetched(corpus, {'wikipedia': False, 'search_results': [], 'search_limit': 5})
+
+    assert corpus['wikipedia_fetched']
+    assert corpus['wikipedia'] is None
+    assert corpus['version'] == 0
+
+def test_merge_prefetched_skips_failed_wikipedia():
+    corpus = new_corpus(TOPIC)
+    merge_prefetched(corpus, {'wikipedia': None, 'search_results': results(5), 'search_limit': 5})
+
+    assert not corpus['wikipedia_fetched']
+    assert missing_sources(corpus, 3)
+    assert corpus['search_limit'] == 5
+    assert corpus['version'] == 1